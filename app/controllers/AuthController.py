@@ -1,23 +1,25 @@
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from config.database import get_db
+from fastapi import Depends, Response
 from app.services.AuthService import AuthService
-from app.schemas.auth_schema import LoginRequest, Token, RefreshTokenRequest
+from app.schemas.auth_schema import LoginRequest, RefreshTokenRequest
+from app.utils.dependencies import get_auth_service
+from app.utils.responses import model_response
 
 
 class AuthController:
     @staticmethod
     async def login(
-        login_data: LoginRequest, db: AsyncSession = Depends(get_db)
-    ) -> Token:
+        login_data: LoginRequest,
+        auth_service: AuthService = Depends(get_auth_service),
+    ) -> Response:
         """Login user"""
-        auth_service = AuthService(db)
-        return await auth_service.login(login_data)
+        return model_response(await auth_service.login(login_data))
 
     @staticmethod
     async def refresh_token(
-        refresh_data: RefreshTokenRequest, db: AsyncSession = Depends(get_db)
-    ) -> Token:
+        refresh_data: RefreshTokenRequest,
+        auth_service: AuthService = Depends(get_auth_service),
+    ) -> Response:
         """Refresh access token"""
-        auth_service = AuthService(db)
-        return await auth_service.refresh_token(refresh_data.refresh_token)
+        return model_response(
+            await auth_service.refresh_token(refresh_data.refresh_token)
+        )
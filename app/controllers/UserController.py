@@ -1,66 +1,86 @@
-from fastapi import Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from config.database import get_db
+from fastapi import Depends, HTTPException, Response, status
+from redis.asyncio import Redis
+from config.redis import get_redis
 from app.services.UserService import UserService
-from app.schemas.user_schema import UserCreate, UserUpdate, UserResponse
-from app.utils.dependencies import get_current_user, get_current_admin
-from app.models.User import User
+from app.schemas.auth_schema import TokenData
+from app.schemas.user_schema import (
+    UserCreate,
+    UserUpdate,
+    UserResponse,
+    USER_LIST_ADAPTER,
+)
+from app.utils.cache import invalidate_user
+from app.utils.responses import adapter_response, model_response
+from app.utils.dependencies import (
+    get_current_user,
+    get_current_admin,
+    ensure_self_or_admin,
+    get_user_service,
+)
 
 
 class UserController:
     @staticmethod
     async def create_user(
-        user_data: UserCreate, db: AsyncSession = Depends(get_db)
-    ) -> UserResponse:
+        user_data: UserCreate,
+        user_service: UserService = Depends(get_user_service),
+    ) -> Response:
         """Register a new user"""
-        user_service = UserService(db)
-        return await user_service.create_user(user_data)
+        user = await user_service.create_user(user_data)
+        return model_response(user, status_code=status.HTTP_201_CREATED)
 
     @staticmethod
     async def get_user(
         user_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
-    ) -> UserResponse:
+        user_service: UserService = Depends(get_user_service),
+        current_user: UserResponse = Depends(get_current_user),
+    ) -> Response:
         """Get user by ID"""
-        user_service = UserService(db)
-        return await user_service.get_user_by_id(user_id)
+        return model_response(await user_service.get_user_by_id(user_id))
 
     @staticmethod
     async def get_all_users(
         skip: int = 0,
         limit: int = 100,
-        db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_admin),
-    ) -> List[UserResponse]:
+        user_service: UserService = Depends(get_user_service),
+        current_user: TokenData = Depends(get_current_admin),
+    ) -> Response:
         """Get all users (superuser only)"""
-        user_service = UserService(db)
-        return await user_service.get_all_users(skip=skip, limit=limit)
+        users = await user_service.get_all_users(skip=skip, limit=limit)
+        return adapter_response(USER_LIST_ADAPTER, users)
 
     @staticmethod
     async def update_user(
         user_id: int,
         user_data: UserUpdate,
-        db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_user),
-    ) -> UserResponse:
-        """Update user"""
-        user_service = UserService(db)
-        return await user_service.update_user(user_id, user_data)
+        user_service: UserService = Depends(get_user_service),
+        current_user: UserResponse = Depends(ensure_self_or_admin),
+        redis: Redis = Depends(get_redis),
+    ) -> Response:
+        """Update user (self or admin)"""
+        # The service commits first, so the cache can't be refilled with the old row
+        user = await user_service.update_user(
+            user_id, user_data, is_admin=current_user.role_name == "admin"
+        )
+        await invalidate_user(redis, user_id)
+        return model_response(user)
 
     @staticmethod
     async def delete_user(
         user_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_admin),
+        user_service: UserService = Depends(get_user_service),
+        current_user: TokenData = Depends(get_current_admin),
+        redis: Redis = Depends(get_redis),
     ) -> dict:
         """Delete user (superuser only)"""
-        user_service = UserService(db)
+        # The service commits first, so the cache can't be refilled with the old row
         await user_service.delete_user(user_id)
+        await invalidate_user(redis, user_id)
         return {"message": "User deleted successfully"}
 
     @staticmethod
-    async def get_me(current_user: User = Depends(get_current_user)) -> UserResponse:
+    async def get_me(
+        current_user: UserResponse = Depends(get_current_user),
+    ) -> Response:
         """Get current user profile"""
-        return UserResponse.model_validate(current_user)
+        return model_response(current_user)
@@ -1,5 +1,5 @@
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -10,10 +10,10 @@ logger = logging.getLogger(__name__)
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors"""
     logger.error(f"Validation error: {exc.errors()}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": exc.errors(),
@@ -24,10 +24,10 @@ async def validation_exception_handler(
 
 async def sqlalchemy_exception_handler(
     request: Request, exc: SQLAlchemyError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle SQLAlchemy errors"""
     logger.error(f"Database error: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Database error occurred",
@@ -38,10 +38,10 @@ async def sqlalchemy_exception_handler(
 
 async def integrity_exception_handler(
     request: Request, exc: IntegrityError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle database integrity errors (unique constraints, etc.)"""
     logger.error(f"Integrity error: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_409_CONFLICT,
         content={
             "detail": "Data integrity error",
@@ -50,10 +50,10 @@ async def integrity_exception_handler(
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle all other exceptions"""
     logger.exception(f"Unexpected error: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "An unexpected error occurred",
@@ -2,13 +2,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config.settings import settings
 
+# Explicit lists matching the routes, so preflights skip the wildcard handling
+ALLOWED_METHODS = ["GET", "POST", "PATCH", "DELETE", "OPTIONS"]
+ALLOWED_HEADERS = ["authorization", "content-type", "accept"]
+
 
 def setup_cors(app: FastAPI):
     """Setup CORS middleware"""
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.get_allowed_origins(),
+        allow_origins=settings.allowed_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=ALLOWED_METHODS,
+        allow_headers=ALLOWED_HEADERS,
     )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict, Tuple
 from sqlalchemy import Integer, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -9,9 +9,8 @@ from config.database import Base
 class BaseModel(Base):
     __abstract__ = True
 
-    id: Mapped[int] = mapped_column(
-        Integer, primary_key=True, index=True, autoincrement=True
-    )
+    # The primary key is already the clustered index, no secondary index needed
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_on: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -22,6 +21,21 @@ class BaseModel(Base):
         nullable=False,
     )
 
+    # Attribute names of the mapped columns, computed once per model class
+    _column_attrs: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        mapper = cls.__dict__.get("__mapper__")
+        if mapper is not None:
+            # Attribute keys can differ from column names (hashed_password -> password)
+            cls._column_attrs = tuple(
+                mapper.get_property_by_column(column).key
+                for column in cls.__table__.columns
+            )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary"""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        # Read loaded state directly, skipping descriptor dispatch and lazy loads
+        state = self.__dict__
+        return {name: state.get(name) for name in self._column_attrs}
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
 class Role(BaseModel):
     __tablename__ = "roles"
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     role_name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
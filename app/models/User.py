@@ -1,5 +1,5 @@
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timezone
 from app.models.BaseModel import BaseModel
@@ -13,13 +13,14 @@ class User(BaseModel):
     __tablename__ = "users"
 
     # Identifiers
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    uuid: Mapped[str] = mapped_column(
-        String, unique=True, default=lambda: str(uuid_lib.uuid4())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # Native UUID where supported, CHAR(32) on MySQL/MariaDB
+    uuid: Mapped[uuid_lib.UUID] = mapped_column(
+        Uuid, unique=True, default=uuid_lib.uuid4
     )
     username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
-    hashed_password: Mapped[str] = mapped_column("password", String(500))
+    hashed_password: Mapped[str] = mapped_column("password", String(255))
 
     # Personal Information
     first_name: Mapped[str] = mapped_column(String(100))
@@ -30,6 +31,8 @@ class User(BaseModel):
 
     # role and status
     role_id: Mapped[int] = mapped_column(ForeignKey("roles.id"), default=1, index=True)
+    # Copy of role.role_name so permission checks don't need the roles join
+    role_name: Mapped[str] = mapped_column(String(50), default="user", index=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
 
     # Timestamps
@@ -1,6 +1,7 @@
 from typing import Generic, TypeVar, Type, Optional, List, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import exists, insert, select, update, delete
+from sqlalchemy.engine import Dialect
 from config.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -14,6 +15,11 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
 
+    @property
+    def dialect(self) -> Dialect:
+        """Dialect of the bound engine, used to pick RETURNING when supported"""
+        return self.db.get_bind().dialect
+
     async def get_by_id(self, id: int) -> Optional[ModelType]:
         """Get a single record by ID"""
         # Type checker doesn't know model has id, but BaseModel ensures it
@@ -30,6 +36,13 @@ class BaseRepository(Generic[ModelType]):
 
     async def create(self, **kwargs: Any) -> ModelType:
         """Create a new record"""
+        if self.dialect.insert_returning:
+            # INSERT ... RETURNING hydrates the row, defaults included, in one trip
+            result = await self.db.execute(
+                insert(self.model).values(**kwargs).returning(self.model)
+            )
+            return result.scalar_one()
+
         instance = self.model(**kwargs)
         self.db.add(instance)
         await self.db.flush()
@@ -43,11 +56,20 @@ class BaseRepository(Generic[ModelType]):
             update(self.model).where(self.model.id == id).values(**kwargs)  # type: ignore[attr-defined]
         )
         await self.db.flush()
+        # MariaDB supports INSERT/DELETE ... RETURNING but not UPDATE
         return await self.get_by_id(id)
 
     async def delete(self, id: int) -> bool:
         """Delete a record by ID"""
         # Type checker doesn't know model has id, but BaseModel ensures it
+        if self.dialect.delete_returning:
+            result = await self.db.execute(
+                delete(self.model)
+                .where(self.model.id == id)  # type: ignore[attr-defined]
+                .returning(self.model.id)  # type: ignore[attr-defined]
+            )
+            return result.first() is not None
+
         result = await self.db.execute(
             delete(self.model).where(self.model.id == id)  # type: ignore[attr-defined]
         )
@@ -56,10 +78,12 @@ class BaseRepository(Generic[ModelType]):
         # Type checker doesn't recognize it, but it exists at runtime
         return bool(getattr(result, "rowcount", 0) > 0)
 
+    async def commit(self) -> None:
+        """Commit the session now instead of when the request ends"""
+        await self.db.commit()
+
     async def exists(self, id: int) -> bool:
         """Check if a record exists"""
         # Type checker doesn't know model has id, but BaseModel ensures it
-        result = await self.db.execute(
-            select(self.model.id).where(self.model.id == id)  # type: ignore[attr-defined]
-        )
-        return result.scalar_one_or_none() is not None
+        stmt = select(exists().where(self.model.id == id))  # type: ignore[attr-defined]
+        return bool(await self.db.scalar(stmt))
@@ -0,0 +1,14 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.Role import Role
+from app.repositories.BaseRepository import BaseRepository
+
+
+class RoleRepository(BaseRepository[Role]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(Role, db)
+
+    async def get_role_name(self, id: int) -> Optional[str]:
+        """Get role name by ID"""
+        return await self.db.scalar(select(Role.role_name).where(Role.id == id))
@@ -1,10 +1,40 @@
-from typing import Optional
-from sqlalchemy import select
+from typing import Any, Optional, Tuple
+from sqlalchemy import Row, false, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
+from app.models.Role import Role
 from app.models.User import User
 from app.repositories.BaseRepository import BaseRepository
 
+# Columns needed to authenticate, login never loads the full entity
+CREDENTIAL_COLUMNS = (
+    User.id,
+    User.email,
+    User.username,
+    User.hashed_password,
+    User.is_active,
+    User.role_id,
+    User.role_name,
+)
+
+# Columns UserResponse reads, skipping password and audit timestamps
+RESPONSE_COLUMNS = (
+    User.id,
+    User.uuid,
+    User.email,
+    User.username,
+    User.first_name,
+    User.middle_name,
+    User.last_name,
+    User.phone_number,
+    User.phone_number2,
+    User.role_id,
+    User.role_name,
+    User.is_active,
+    User.created_on,
+    User.updated_on,
+)
+
 
 class UserRepository(BaseRepository[User]):
     def __init__(self, db: AsyncSession):
@@ -18,52 +48,89 @@ class UserRepository(BaseRepository[User]):
         await self.db.refresh(user, ["role"])  # Eagerly load the role
         return user
 
-    async def get_by_id(self, id: int) -> Optional[User]:
-        """Get user by ID with role loaded"""
+    async def get_by_id(self, id: int, load_role: bool = False) -> Optional[User]:
+        """Get user by ID, joining the role in the same query when asked"""
+        stmt = select(User).where(User.id == id)
+        if load_role:
+            # role_id is required, so an inner join never drops the user
+            stmt = stmt.options(joinedload(User.role, innerjoin=True))
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_credentials_by_email(self, email: str) -> Optional[Row[Any]]:
+        """Get login columns by email"""
         result = await self.db.execute(
-            select(User).options(selectinload(User.role)).where(User.id == id)
+            select(*CREDENTIAL_COLUMNS).where(User.email == email)
         )
-        return result.scalar_one_or_none()
+        return result.first()
 
-    async def get_by_email(self, email: str) -> Optional[User]:
-        """Get user by email"""
+    async def get_credentials_by_id(self, id: int) -> Optional[Row[Any]]:
+        """Get login columns by ID"""
         result = await self.db.execute(
-            select(User).options(selectinload(User.role)).where(User.email == email)
+            select(*CREDENTIAL_COLUMNS).where(User.id == id)
         )
-        return result.scalar_one_or_none()
+        return result.first()
 
     async def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        result = await self.db.execute(
-            select(User)
-            .options(selectinload(User.role))
-            .where(User.username == username)
-        )
+        result = await self.db.execute(select(User).where(User.username == username))
         return result.scalar_one_or_none()
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[User]:
-        """Get all users with roles loaded"""
+    async def list_projection(self, skip: int = 0, limit: int = 100) -> list[Row[Any]]:
+        """Get a page of response columns as plain rows, no ORM entities"""
+        # role_name is denormalized on users, only the description needs roles
         result = await self.db.execute(
-            select(User).options(selectinload(User.role)).offset(skip).limit(limit)
+            select(*RESPONSE_COLUMNS, Role.description.label("role_description"))
+            .join(User.role)
+            .order_by(User.id)
+            .offset(skip)
+            .limit(limit)
         )
-        return list(result.scalars().all())
-
-    async def update(self, id: int, **kwargs) -> Optional[User]:
-        """Update user and return with role loaded"""
-        user = await self.get_by_id(id)
-        if user:
-            for key, value in kwargs.items():
-                setattr(user, key, value)
-            await self.db.flush()
+        return list(result.all())
+
+    async def update_loaded(self, user: User, **kwargs) -> User:
+        """Update an already loaded user without selecting it again"""
+        for key, value in kwargs.items():
+            setattr(user, key, value)
+        await self.db.flush()
+
+        # updated_on is set in Python by onupdate, so only a changed role
+        # needs loading
+        if "role_id" in kwargs:
             await self.db.refresh(user, ["role"])
         return user
 
-    async def email_exists(self, email: str) -> bool:
-        """Check if email exists"""
-        result = await self.db.execute(select(User.id).where(User.email == email))
-        return result.scalar_one_or_none() is not None
+    async def update_password(self, id: int, hashed_password: str) -> None:
+        """Replace the stored password hash without loading the user"""
+        await self.db.execute(
+            update(User).where(User.id == id).values(hashed_password=hashed_password)
+        )
+
+    async def find_conflicts(
+        self,
+        email: Optional[str] = None,
+        username: Optional[str] = None,
+        exclude_id: Optional[int] = None,
+    ) -> Tuple[bool, bool]:
+        """Check email and username uniqueness in one query"""
+        conditions = []
+        if email is not None:
+            conditions.append(User.email == email)
+        if username is not None:
+            conditions.append(User.username == username)
+        if not conditions:
+            return False, False
+
+        # Matches are evaluated in SQL so the column collation applies
+        stmt = select(
+            (User.email == email if email is not None else false()).label("email"),
+            (
+                User.username == username if username is not None else false()
+            ).label("username"),
+        ).where(or_(*conditions))
+        if exclude_id is not None:
+            stmt = stmt.where(User.id != exclude_id)
 
-    async def username_exists(self, username: str) -> bool:
-        """Check if username exists"""
-        result = await self.db.execute(select(User.id).where(User.username == username))
-        return result.scalar_one_or_none() is not None
+        # email and username are both unique, so at most two rows match
+        rows = (await self.db.execute(stmt.limit(2))).all()
+        return any(row.email for row in rows), any(row.username for row in rows)
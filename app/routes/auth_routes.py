@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.controllers.AuthController import AuthController
 from app.schemas.auth_schema import Token, LoginRequest, RefreshTokenRequest
-from config.database import get_db
+from app.services.AuthService import AuthService
+from app.utils.dependencies import get_auth_service
 
 router = APIRouter(
     prefix="/auth",
@@ -13,14 +13,14 @@ router = APIRouter(
 
 @router.post(
     "/login",
-    response_model=Token,
+    responses={status.HTTP_200_OK: {"model": Token}},
     status_code=status.HTTP_200_OK,
     summary="User Login",
     description="Authenticate user with email and password, returns access and refresh tokens"
 )
 async def login(
     login_data: LoginRequest,
-    db: AsyncSession = Depends(get_db)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """
     Login with email and password.
@@ -30,19 +30,19 @@ async def login(
 
     Returns access token and refresh token for subsequent authenticated requests.
     """
-    return await AuthController.login(login_data, db)
+    return await AuthController.login(login_data, auth_service)
 
 
 @router.post(
     "/refresh",
-    response_model=Token,
+    responses={status.HTTP_200_OK: {"model": Token}},
     status_code=status.HTTP_200_OK,
     summary="Refresh Access Token",
     description="Generate new access token using valid refresh token"
 )
 async def refresh_token(
     refresh_data: RefreshTokenRequest,
-    db: AsyncSession = Depends(get_db)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """
     Refresh access token.
@@ -51,4 +51,4 @@ async def refresh_token(
 
     Returns new access token and refresh token.
     """
-    return await AuthController.refresh_token(refresh_data, db)
+    return await AuthController.refresh_token(refresh_data, auth_service)
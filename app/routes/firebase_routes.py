@@ -8,7 +8,7 @@ To enable Firebase auth:
 1. Install: pip install firebase-admin
 2. Configure Firebase credentials in .env
 3. Uncomment code in app/utils/firebase_auth.py
-4. Call initialize_firebase() in main.py startup event
+4. Set FIREBASE_ENABLED=true, main.py then registers these routes
 """
 
 from typing import Dict, Any
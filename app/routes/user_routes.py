@@ -1,28 +1,33 @@
 from typing import List
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
 from app.controllers.UserController import UserController
-from app.models.User import User
+from app.schemas.auth_schema import TokenData
 from app.schemas.user_schema import UserCreate, UserUpdate, UserResponse
+from app.services.UserService import UserService
 from app.utils.dependencies import (
     get_current_user,
     get_current_active_user,
     get_current_admin,
+    ensure_self_or_admin,
+    get_user_service,
 )
-from config.database import get_db
+from config.redis import get_redis
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.post(
     "",
-    response_model=UserResponse,
+    responses={status.HTTP_201_CREATED: {"model": UserResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Register New User",
     description="Register a new user account",
 )
-async def create_user(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
+async def create_user(
+    user_data: UserCreate, user_service: UserService = Depends(get_user_service)
+):
     """
     Register a new user.
 
@@ -36,18 +41,18 @@ async def create_user(user_data: UserCreate, db: AsyncSession = Depends(get_db))
     - **phone_number2**: User's second phone number (optional)
     Returns the created user information.
     """
-    return await UserController.create_user(user_data, db)
+    return await UserController.create_user(user_data, user_service)
 
 
 @router.get(
     "/me",
-    response_model=UserResponse,
+    responses={status.HTTP_200_OK: {"model": UserResponse}},
     status_code=status.HTTP_200_OK,
     summary="Get Current User Profile",
     description="Get authenticated user's profile information",
 )
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserResponse = Depends(get_current_active_user),
 ):
     """
     Get current authenticated user's profile.
@@ -61,15 +66,15 @@ async def get_current_user_profile(
 
 @router.get(
     "/{user_id}",
-    response_model=UserResponse,
+    responses={status.HTTP_200_OK: {"model": UserResponse}},
     status_code=status.HTTP_200_OK,
     summary="Get User by ID",
     description="Retrieve user information by user ID",
 )
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    user_service: UserService = Depends(get_user_service),
+    current_user: UserResponse = Depends(get_current_active_user),
 ):
     """
     Get user by ID.
@@ -80,12 +85,12 @@ async def get_user(
 
     Returns user information.
     """
-    return await UserController.get_user(user_id, db)
+    return await UserController.get_user(user_id, user_service)
 
 
 @router.get(
     "",
-    response_model=List[UserResponse],
+    responses={status.HTTP_200_OK: {"model": List[UserResponse]}},
     status_code=status.HTTP_200_OK,
     summary="Get All Users",
     description="Retrieve all users (superuser only)",
@@ -93,8 +98,8 @@ async def get_user(
 async def get_all_users(
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin),
+    user_service: UserService = Depends(get_user_service),
+    current_user: TokenData = Depends(get_current_admin),
 ):
     """
     Get all users (admin only).
@@ -106,12 +111,12 @@ async def get_all_users(
 
     Returns list of all users.
     """
-    return await UserController.get_all_users(skip, limit, db)
+    return await UserController.get_all_users(skip, limit, user_service)
 
 
 @router.patch(
     "/{user_id}",
-    response_model=UserResponse,
+    responses={status.HTTP_200_OK: {"model": UserResponse}},
     status_code=status.HTTP_200_OK,
     summary="Update User",
     description="Update user information",
@@ -119,8 +124,10 @@ async def get_all_users(
 async def update_user(
     user_id: int,
     user_data: UserUpdate,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    # Resolved first so a forbidden request never builds the user service
+    current_user: UserResponse = Depends(ensure_self_or_admin),
+    user_service: UserService = Depends(get_user_service),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Update user information.
@@ -131,11 +138,14 @@ async def update_user(
     - **full_name**: New full name (optional)
     - **password**: New password (optional)
 
-    Users can only update their own profile unless they are superuser.
+    Users can only update their own profile unless they are admin. Only
+    admins can change role_id and is_active.
 
     Returns updated user information.
     """
-    return await UserController.update_user(user_id, user_data, db, current_user)
+    return await UserController.update_user(
+        user_id, user_data, user_service, current_user, redis
+    )
 
 
 @router.delete(
@@ -146,8 +156,9 @@ async def update_user(
 )
 async def delete_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_admin),
+    user_service: UserService = Depends(get_user_service),
+    current_user: TokenData = Depends(get_current_admin),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Delete user (admin only).
@@ -158,4 +169,4 @@ async def delete_user(
 
     Returns no content on success.
     """
-    return await UserController.delete_user(user_id, db)
+    return await UserController.delete_user(user_id, user_service, current_user, redis)
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+from app.schemas.fields import Email
 
 
 class Token(BaseModel):
@@ -11,10 +12,12 @@ class TokenData(BaseModel):
     user_id: int | None = None
     username: str | None = None
     uuid: str | None = None
+    role_id: int | None = None
+    is_admin: bool = False
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 
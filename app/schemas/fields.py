@@ -0,0 +1,9 @@
+import re
+from typing import Annotated
+from pydantic import StringConstraints
+
+# Light structural check, the pattern is compiled once by pydantic-core
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Drop-in for EmailStr without the email-validator parser
+Email = Annotated[str, StringConstraints(pattern=EMAIL_RE.pattern, max_length=254)]
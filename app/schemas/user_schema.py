@@ -1,7 +1,9 @@
 from enum import unique
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from typing import Any, List, Optional
 from datetime import datetime
+from uuid import UUID
+from app.schemas.fields import Email
 
 
 class RoleResponse(BaseModel):
@@ -12,17 +14,23 @@ class RoleResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, role: Any) -> "RoleResponse":
+        """Build from a loaded ORM role without validation"""
+        return cls.model_construct(
+            **{name: getattr(role, name) for name in cls.model_fields}
+        )
+
 
 # Base schema with common attributes
 class UserBase(BaseModel):
-    email: EmailStr
+    email: Email
     username: str = Field(..., min_length=3, max_length=50)
     first_name: str = Field(..., min_length=2, max_length=100)
     middle_name: Optional[str] = Field(None, max_length=100)
     last_name: str = Field(..., min_length=2, max_length=100)
     phone_number: str = Field(..., min_length=11, max_length=20)
     phone_number2: Optional[str] = Field(None, min_length=11, max_length=20)
-    role_id: int = Field(default=1)
 
 
 # Schema for creating a user
@@ -32,7 +40,7 @@ class UserCreate(UserBase):
 
 # Schema for updating a user
 class UserUpdate(BaseModel):
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     username: Optional[str] = Field(None, min_length=3, max_length=100)
     first_name: Optional[str] = Field(None, min_length=2, max_length=100)
     middle_name: Optional[str] = Field(None, max_length=100)
@@ -47,7 +55,9 @@ class UserUpdate(BaseModel):
 # Schema for user response
 class UserResponse(UserBase):
     id: int
-    uuid: str
+    uuid: UUID
+    role_id: int
+    role_name: str
     is_active: bool
     created_on: datetime
     updated_on: datetime
@@ -55,6 +65,30 @@ class UserResponse(UserBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_orm_fast(cls, user: Any) -> "UserResponse":
+        """Build from a loaded ORM user without validation, DB rows are trusted"""
+        values = {
+            name: getattr(user, name) for name in cls.model_fields if name != "role"
+        }
+        return cls.model_construct(role=RoleResponse.from_orm_fast(user.role), **values)
+
+    @classmethod
+    def from_row(cls, row: Any) -> "UserResponse":
+        """Build from a projected row with a role_description column"""
+        values = row._asdict()
+        role = RoleResponse.model_construct(
+            id=values["role_id"],
+            role_name=values["role_name"],
+            description=values.pop("role_description"),
+        )
+        return cls.model_construct(role=role, **values)
+
+
+# Adapters built once at import so their validators are reused per call
+USER_ADAPTER = TypeAdapter(UserResponse)
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
 
 # Schema for user in database (internal use)
 class UserInDB(UserResponse):
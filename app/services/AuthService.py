@@ -1,76 +1,129 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import Row
 from fastapi import HTTPException, status
+from redis.asyncio import Redis
+from config.settings import settings
 from app.repositories.UserRepository import UserRepository
 from app.schemas.auth_schema import LoginRequest, Token
 from app.utils.security import (
-    verify_password,
+    DUMMY_PASSWORD_HASH,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
     create_access_token,
-    create_refresh_token,
-    decode_token,
+    generate_refresh_token,
 )
+from app.utils.cache import login_cache_key, password_fingerprint, refresh_token_key
 
 
 class AuthService:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self.user_repo = UserRepository(db)
+    def __init__(self, user_repo: UserRepository, redis: Redis):
+        self.user_repo = user_repo
+        self.redis = redis
 
     async def login(self, login_data: LoginRequest) -> Token:
         """Authenticate user and return tokens"""
-        user = await self.user_repo.get_by_email(login_data.email)
+        cache_key = login_cache_key(login_data.email, login_data.password)
+        user = await self._get_cached_login_user(cache_key, login_data.email)
+        cache_hit = user is not None
 
-        if not user or not verify_password(login_data.password, user.hashed_password):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect email or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        if user is None:
+            user = await self.user_repo.get_credentials_by_email(login_data.email)
+
+            # Password hashing is CPU bound, run it off the event loop. Unknown
+            # emails verify a dummy hash so timing doesn't reveal them
+            hashed_password = user.hashed_password if user else DUMMY_PASSWORD_HASH
+            if (
+                not await verify_password_async(login_data.password, hashed_password)
+                or not user
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Incorrect email or password",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
 
         if not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
             )
 
-        # Create tokens
-        access_token = create_access_token(
-            data={"user_id": user.id, "username": user.username}
-        )
-        refresh_token = create_refresh_token(data={"user_id": user.id})
+        if not cache_hit:
+            hashed_password = user.hashed_password
+            # Upgrade bcrypt or outdated argon2 hashes now the password is known
+            if password_needs_rehash(hashed_password):
+                hashed_password = await get_password_hash_async(login_data.password)
+                await self.user_repo.update_password(user.id, hashed_password)
 
-        return Token(
-            access_token=access_token, refresh_token=refresh_token, token_type="bearer"
-        )
+            # Remember the successful verification so repeated logins skip hashing
+            await self.redis.setex(
+                cache_key,
+                settings.LOGIN_CACHE_TTL_SECONDS,
+                f"{user.id}:{password_fingerprint(hashed_password)}",
+            )
+
+        return await self._issue_tokens(self._token_claims(user))
+
+    @staticmethod
+    def _token_claims(user: Row[Any]) -> Dict[str, Any]:
+        """Build token claims, role info lets admin checks skip the user lookup"""
+        return {
+            "user_id": user.id,
+            "username": user.username,
+            "rid": user.role_id,
+            "su": user.role_name == "admin",
+        }
+
+    async def _get_cached_login_user(
+        self, cache_key: str, email: str
+    ) -> Optional[Row[Any]]:
+        """Get user from a cached login, unless the password changed since"""
+        cached = await self.redis.get(cache_key)
+        if cached is None:
+            return None
+
+        user_id, fingerprint = cached.split(":", 1)
+        user = await self.user_repo.get_credentials_by_id(int(user_id))
+        if (
+            user is None
+            or user.email != email
+            or password_fingerprint(user.hashed_password) != fingerprint
+        ):
+            await self.redis.delete(cache_key)
+            return None
+        return user
 
     async def refresh_token(self, refresh_token: str) -> Token:
-        """Refresh access token"""
-        payload = decode_token(refresh_token)
+        """Exchange a refresh token for new tokens, each one is single use"""
+        user_id = await self.redis.getdel(refresh_token_key(refresh_token))
 
-        if payload is None or payload.get("type") != "refresh":
+        if user_id is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
             )
 
-        user_id = payload.get("user_id")
-        if user_id is None:
+        # Rebuild claims from the user row so role changes and deactivation
+        # take effect on the next refresh
+        user = await self.user_repo.get_credentials_by_id(int(user_id))
+        if user is None or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
             )
 
-        user = await self.user_repo.get_by_id(user_id)
-        if not user or not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found or inactive",
-            )
+        return await self._issue_tokens(self._token_claims(user))
 
-        # Create new tokens
-        new_access_token = create_access_token(
-            data={"user_id": user.id, "username": user.username}
+    async def _issue_tokens(self, claims: Dict[str, Any]) -> Token:
+        """Create access token and store a new refresh token for its user"""
+        refresh_token = generate_refresh_token()
+        # Signing is a single HMAC now, cheaper inline than a thread hop
+        access_token = create_access_token(claims)
+        await self.redis.setex(
+            refresh_token_key(refresh_token),
+            timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            claims["user_id"],
         )
-        new_refresh_token = create_refresh_token(data={"user_id": user.id})
 
         return Token(
-            access_token=new_access_token,
-            refresh_token=new_refresh_token,
-            token_type="bearer",
+            access_token=access_token, refresh_token=refresh_token, token_type="bearer"
         )
@@ -1,36 +1,34 @@
+import asyncio
 from typing import List, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
+from app.repositories.RoleRepository import RoleRepository
 from app.repositories.UserRepository import UserRepository
-from app.schemas.user_schema import UserCreate, UserUpdate, UserResponse
-from app.utils.security import get_password_hash
+from app.schemas.user_schema import (
+    UserCreate,
+    UserUpdate,
+    UserResponse,
+)
+from app.utils.security import get_password_hash_async
 from app.models.User import User
 
+# UserUpdate fields a user may not change on their own account
+ADMIN_ONLY_FIELDS = frozenset({"role_id", "is_active"})
+
 
 class UserService:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self.user_repo = UserRepository(db)
+    def __init__(self, user_repo: UserRepository, role_repo: RoleRepository):
+        self.user_repo = user_repo
+        self.role_repo = role_repo
 
     async def create_user(self, user_data: UserCreate) -> UserResponse:
         """Create a new user"""
-        # Check if email already exists
-        if await self.user_repo.email_exists(user_data.email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
-
-        # Check if username already exists
-        if await self.user_repo.username_exists(user_data.username):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken"
-            )
-
-        # Hash password
-        hashed_password = get_password_hash(user_data.password)
+        # Hash on the pool while the uniqueness check runs
+        _, hashed_password = await asyncio.gather(
+            self._check_conflicts(user_data.email, user_data.username),
+            get_password_hash_async(user_data.password),
+        )
 
-        # Create user
+        # Registration is public, role_id and role_name keep the model defaults
         user = await self.user_repo.create(
             email=user_data.email,
             username=user_data.username,
@@ -39,62 +37,62 @@ class UserService:
             middle_name=user_data.middle_name,
             phone_number=user_data.phone_number,
             phone_number2=user_data.phone_number2,
-            role_id=user_data.role_id,
             hashed_password=hashed_password,
         )
 
-        return UserResponse.model_validate(user)
+        return UserResponse.from_orm_fast(user)
 
     async def get_user_by_id(self, user_id: int) -> UserResponse:
         """Get user by ID"""
-        user = await self.user_repo.get_by_id(user_id)
+        user = await self.user_repo.get_by_id(user_id, load_role=True)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
-        return UserResponse.model_validate(user)
+        return UserResponse.from_orm_fast(user)
 
     async def get_all_users(
         self, skip: int = 0, limit: int = 100
     ) -> List[UserResponse]:
         """Get all users"""
-        users = await self.user_repo.get_all(skip=skip, limit=limit)
-        return [UserResponse.model_validate(user) for user in users]
+        rows = await self.user_repo.list_projection(skip=skip, limit=limit)
+        return [UserResponse.from_row(row) for row in rows]
+
+    async def update_user(
+        self, user_id: int, user_data: UserUpdate, is_admin: bool = False
+    ) -> UserResponse:
+        """Update user, role and active status can only be changed by admins"""
+        if not is_admin and user_data.model_fields_set & ADMIN_ONLY_FIELDS:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges"
+            )
 
-    async def update_user(self, user_id: int, user_data: UserUpdate) -> UserResponse:
-        """Update user"""
-        user = await self.user_repo.get_by_id(user_id)
+        user = await self.user_repo.get_by_id(user_id, load_role=True)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
 
-        update_data = user_data.model_dump(exclude_unset=True)
-
-        # Hash password if provided
-        if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(
-                update_data.pop("password")
+        # UserUpdate is flat, read the set fields directly instead of model_dump
+        update_data = {
+            name: getattr(user_data, name) for name in user_data.model_fields_set
+        }
+        password = update_data.pop("password", None)
+
+        if password is None:
+            await self._check_user_changes(user_id, update_data)
+        else:
+            # Hash the new password on the pool while the checks run
+            _, update_data["hashed_password"] = await asyncio.gather(
+                self._check_user_changes(user_id, update_data),
+                get_password_hash_async(password),
             )
 
-        # Check email uniqueness if changed
-        if "email" in update_data and update_data["email"] != user.email:
-            if await self.user_repo.email_exists(update_data["email"]):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered",
-                )
-
-        # Check username uniqueness if changed
-        if "username" in update_data and update_data["username"] != user.username:
-            if await self.user_repo.username_exists(update_data["username"]):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already taken",
-                )
-
-        updated_user = await self.user_repo.update(user_id, **update_data)
-        return UserResponse.model_validate(updated_user)
+        updated_user = await self.user_repo.update_loaded(user, **update_data)
+        # Commit before the caller drops cached copies, otherwise a reader
+        # could re-cache the old row in between
+        await self.user_repo.commit()
+        return UserResponse.from_orm_fast(updated_user)
 
     async def delete_user(self, user_id: int) -> bool:
         """Delete user"""
@@ -104,4 +102,48 @@ class UserService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
 
-        return await self.user_repo.delete(user_id)
+        deleted = await self.user_repo.delete(user_id)
+        # Commit before the caller drops cached copies, as in update_user
+        await self.user_repo.commit()
+        return deleted
+
+    async def _check_user_changes(self, user_id: int, update_data: dict) -> None:
+        """Reject conflicting changes and fill in role_name for a new role_id"""
+        await self._check_conflicts(
+            update_data.get("email"), update_data.get("username"), exclude_id=user_id
+        )
+
+        # Keep the denormalized role name in step with role_id
+        if "role_id" in update_data:
+            update_data["role_name"] = await self._get_role_name(
+                update_data["role_id"]
+            )
+
+    async def _check_conflicts(
+        self,
+        email: Optional[str],
+        username: Optional[str],
+        exclude_id: Optional[int] = None,
+    ) -> None:
+        """Check email and username uniqueness in one round trip"""
+        email_taken, username_taken = await self.user_repo.find_conflicts(
+            email=email, username=username, exclude_id=exclude_id
+        )
+        if email_taken:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered",
+            )
+        if username_taken:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken"
+            )
+
+    async def _get_role_name(self, role_id: int) -> str:
+        """Get role name for role_id, rejecting unknown roles"""
+        role_name = await self.role_repo.get_role_name(role_id)
+        if role_name is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid role"
+            )
+        return role_name
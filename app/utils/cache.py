@@ -0,0 +1,86 @@
+import hashlib
+from typing import Optional
+from cachetools import TTLCache
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from config.settings import settings
+from app.schemas.user_schema import UserResponse, USER_ADAPTER
+
+LOGIN_CACHE_PREFIX = "auth:verify:"
+REFRESH_TOKEN_PREFIX = "rt:"
+USER_CACHE_PREFIX = "user:"
+
+_CACHE_KEY_SECRET = hashlib.sha256(settings.SECRET_KEY.encode("utf-8")).digest()
+
+# L1 user cache, saves the Redis round trip on repeat requests to this worker
+_LOCAL_USER_CACHE: Optional[TTLCache] = (
+    TTLCache(
+        maxsize=settings.USER_LOCAL_CACHE_MAXSIZE,
+        ttl=settings.USER_LOCAL_CACHE_TTL_SECONDS,
+    )
+    if settings.USER_LOCAL_CACHE_TTL_SECONDS > 0
+    else None
+)
+
+
+def login_cache_key(email: str, password: str) -> str:
+    """Build the verified-login cache key without exposing the password"""
+    password_digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
+    digest = hashlib.blake2b(
+        f"{email}:{password_digest}".encode("utf-8"),
+        digest_size=16,
+        key=_CACHE_KEY_SECRET,
+    ).hexdigest()
+    return f"{LOGIN_CACHE_PREFIX}{digest}"
+
+
+def password_fingerprint(hashed_password: str) -> str:
+    """Short fingerprint of a stored hash, changes whenever the password does"""
+    return hashlib.blake2b(hashed_password.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def refresh_token_key(refresh_token: str) -> str:
+    """Build the refresh token key, only a digest of the token is stored"""
+    return f"{REFRESH_TOKEN_PREFIX}{hashlib.sha256(refresh_token.encode('utf-8')).hexdigest()}"
+
+
+def user_cache_key(user_id: int) -> str:
+    """Build the cached user profile key"""
+    return f"{USER_CACHE_PREFIX}{user_id}"
+
+
+async def get_cached_user(redis: Redis, user_id: int) -> Optional[UserResponse]:
+    """Get cached user profile, checking this process before Redis"""
+    if _LOCAL_USER_CACHE is not None:
+        user = _LOCAL_USER_CACHE.get(user_id)
+        if user is not None:
+            return user
+
+    cached = await redis.get(user_cache_key(user_id))
+    if cached is None:
+        return None
+    try:
+        user = USER_ADAPTER.validate_json(cached)
+    except ValidationError:
+        # Entry written with an older schema, treat it as a miss
+        return None
+
+    if _LOCAL_USER_CACHE is not None:
+        _LOCAL_USER_CACHE[user_id] = user
+    return user
+
+
+async def cache_user(redis: Redis, user: UserResponse) -> None:
+    """Cache user profile"""
+    if _LOCAL_USER_CACHE is not None:
+        _LOCAL_USER_CACHE[user.id] = user
+    await redis.setex(
+        user_cache_key(user.id), settings.USER_CACHE_TTL_SECONDS, user.model_dump_json()
+    )
+
+
+async def invalidate_user(redis: Redis, user_id: int) -> None:
+    """Drop cached user profile after it was changed"""
+    if _LOCAL_USER_CACHE is not None:
+        _LOCAL_USER_CACHE.pop(user_id, None)
+    await redis.delete(user_cache_key(user_id))
@@ -1,48 +1,87 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from redis.asyncio import Redis
 from config.database import get_db
+from config.redis import get_redis
 from app.utils.security import decode_token
+from app.utils.cache import get_cached_user, cache_user
+from app.repositories.RoleRepository import RoleRepository
 from app.repositories.UserRepository import UserRepository
-from app.models.User import User
+from app.services.AuthService import AuthService
+from app.services.UserService import UserService
+from app.schemas.auth_schema import TokenData
+from app.schemas.user_schema import UserResponse
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    """Get current authenticated user"""
-    token = credentials.credentials
-    payload = decode_token(token)
+async def get_user_repo(db: AsyncSession = Depends(get_db)) -> UserRepository:
+    """Get user repository, built once per request and shared by dependents"""
+    return UserRepository(db)
 
-    if payload is None or payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
 
-    user_id: Optional[int] = payload.get("user_id")
-    if user_id is None:
+async def get_role_repo(db: AsyncSession = Depends(get_db)) -> RoleRepository:
+    """Get role repository for the request session"""
+    return RoleRepository(db)
+
+
+async def get_user_service(
+    user_repo: UserRepository = Depends(get_user_repo),
+    role_repo: RoleRepository = Depends(get_role_repo),
+) -> UserService:
+    """Get user service for the request session"""
+    return UserService(user_repo, role_repo)
+
+
+async def get_auth_service(
+    user_repo: UserRepository = Depends(get_user_repo),
+    redis: Redis = Depends(get_redis),
+) -> AuthService:
+    """Get auth service for the request session"""
+    return AuthService(user_repo, redis)
+
+
+def _decode_access_token(credentials: HTTPAuthorizationCredentials) -> dict:
+    """Decode an access token, rejecting anything without a user_id"""
+    payload = decode_token(credentials.credentials)
+
+    if (
+        payload is None
+        or payload.get("type") != "access"
+        or payload.get("user_id") is None
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return payload
+
 
-    # After None check, user_id is guaranteed to be int
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_repo: UserRepository = Depends(get_user_repo),
+    redis: Redis = Depends(get_redis),
+) -> UserResponse:
+    """Get current authenticated user, served from cache when possible"""
+    payload = _decode_access_token(credentials)
+    user_id: int = payload["user_id"]
+
+    user = await get_cached_user(redis, user_id)
 
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        db_user = await user_repo.get_by_id(user_id, load_role=True)
+
+        if db_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        user = UserResponse.from_orm_fast(db_user)
+        await cache_user(redis, user)
 
     if not user.is_active:
         raise HTTPException(
@@ -53,17 +92,37 @@ async def get_current_user(
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: UserResponse = Depends(get_current_user),
+) -> UserResponse:
     """Get current active user"""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
 
-async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
-    """Get current admin user"""
-    if current_user.role.role_name != "admin":  # or role_id != 1
+async def get_current_admin(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> TokenData:
+    """Get current admin from token claims, without loading the user"""
+    payload = _decode_access_token(credentials)
+    if not payload.get("su"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges"
+        )
+    return TokenData(
+        user_id=payload["user_id"],
+        username=payload.get("username"),
+        role_id=payload.get("rid"),
+        is_admin=True,
+    )
+
+
+async def ensure_self_or_admin(
+    user_id: int,
+    current_user: UserResponse = Depends(get_current_active_user),
+) -> UserResponse:
+    """Allow only the user themselves or an admin"""
+    if user_id != current_user.id and current_user.role_name != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges"
         )
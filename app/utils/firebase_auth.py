@@ -43,10 +43,7 @@ def initialize_firebase():
     1. Using a service account JSON file
     2. Using environment variables for credentials
 
-    Add this to main.py startup event:
-        @app.on_event("startup")
-        async def startup_event():
-            initialize_firebase()
+    Called from the lifespan handler in main.py when FIREBASE_ENABLED is set.
     """
     global firebase_app
 
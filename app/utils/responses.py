@@ -0,0 +1,28 @@
+from typing import Any
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+# Routes returning these declare their schemas under responses= for the
+# OpenAPI docs instead of response_model
+
+
+def model_response(
+    model: BaseModel, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize a schema in pydantic-core, skipping FastAPI's encoder"""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def adapter_response(
+    adapter: TypeAdapter, value: Any, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize a value through a prebuilt TypeAdapter"""
+    return Response(
+        content=adapter.dump_json(value),
+        status_code=status_code,
+        media_type="application/json",
+    )
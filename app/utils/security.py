@@ -1,10 +1,38 @@
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional
+import orjson
 from jose import JWTError, jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from passlib.context import CryptContext
 from config.settings import settings
 
 # Password hashing
+# New hashes use argon2id, bcrypt is only kept to verify existing hashes
+password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_KIB,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# Verified against for unknown emails so those logins take as long as real ones
+DUMMY_PASSWORD_HASH = password_hasher.hash("not-a-password")
+
+# Hashing is CPU and memory heavy, its own pool keeps it off the event loop
+# and caps concurrent argon2 buffers. argon2-cffi releases the GIL while hashing
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
 # Configure bcrypt with truncate_error=False to handle long passwords
 pwd_context = CryptContext(
     schemes=["bcrypt"],
@@ -15,50 +43,136 @@ pwd_context = CryptContext(
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash"""
+    """Verify a password against an argon2id or legacy bcrypt hash"""
+    if hashed_password.startswith("$argon2"):
+        try:
+            return password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
     # Bcrypt has a 72 byte limit, truncate if necessary
     password_bytes = plain_password.encode('utf-8')[:72]
     return pwd_context.verify(password_bytes.decode('utf-8'), hashed_password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _HASH_POOL, verify_password, plain_password, hashed_password
+    )
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash is bcrypt or uses outdated argon2 parameters"""
+    if not hashed_password.startswith("$argon2"):
+        return True
+    try:
+        return password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
 def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    # Bcrypt has a 72 byte limit, truncate if necessary
-    password_bytes = password.encode('utf-8')[:72]
-    return pwd_context.hash(password_bytes.decode('utf-8'))
+    """Hash a password with argon2id"""
+    return password_hasher.hash(password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, get_password_hash, password)
+
+
+# Signing key resolved once, HS256 tokens are signed and verified with hmac
+_JWT_KEY = settings.JWT_SECRET_KEY.encode("utf-8")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Encode a JWT segment as unpadded base64url"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    """Decode an unpadded base64url JWT segment"""
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+# The header never changes, encode it once
+_HS256_HEADER_SEGMENT = _b64url_encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+def _encode_hs256(claims: dict) -> str:
+    """Sign an HS256 token without going through jose"""
+    signing_input = (
+        _HS256_HEADER_SEGMENT + b"." + _b64url_encode(orjson.dumps(claims))
+    )
+    signature = hmac.new(_JWT_KEY, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
-    to_encode = data.copy()
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    to_encode = {
+        **data,
+        "exp": int(time.time() + expires_delta.total_seconds()),
+        "type": "access",
+    }
+    if settings.JWT_ALGORITHM == "HS256":
+        return _encode_hs256(to_encode)
 
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(
+    return jwt.encode(
         to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
     )
-    return encoded_jwt
 
 
-def create_refresh_token(data: dict) -> str:
-    """Create JWT refresh token"""
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
-    return encoded_jwt
+def generate_refresh_token() -> str:
+    """Generate an opaque refresh token, its state is kept server side"""
+    return secrets.token_urlsafe(32)
+
+
+def _decode_hs256(token: str) -> Optional[dict]:
+    """Verify an HS256 token without going through jose"""
+    try:
+        signing_input, _, signature = token.encode("ascii").rpartition(b".")
+        header_segment, _, payload_segment = signing_input.partition(b".")
+        if not header_segment or not payload_segment or b"." in payload_segment:
+            return None
+
+        header = orjson.loads(_b64url_decode(header_segment))
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            return None
+
+        expected = hmac.new(_JWT_KEY, signing_input, hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature)):
+            return None
+
+        payload = orjson.loads(_b64url_decode(payload_segment))
+    except (UnicodeEncodeError, binascii.Error, orjson.JSONDecodeError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+
+    # Same time checks as jose, with exp required since every token sets it
+    now = time.time()
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)) or exp < now:
+        return None
+    nbf = payload.get("nbf")
+    if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+        return None
+    return payload
 
 
 def decode_token(token: str) -> Optional[dict]:
     """Decode and verify JWT token"""
+    if settings.JWT_ALGORITHM == "HS256":
+        return _decode_hs256(token)
+
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
@@ -7,9 +7,18 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.APP_DEBUG,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_recycle=3600,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # Recycle before MySQL's wait_timeout or a proxy drops idle connections
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Sessions always commit or roll back before closing, so the pool's
+    # extra ROLLBACK on every checkin is a wasted round trip
+    pool_reset_on_return=None,
+    # Reuse the most recently returned connection, idle extras then age out
+    pool_use_lifo=True,
+    # Avoids InnoDB's REPEATABLE READ gap locks, no query here relies on them
+    isolation_level=settings.DB_ISOLATION_LEVEL,
 )
 
 # Create async session factory
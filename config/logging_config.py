@@ -0,0 +1,30 @@
+import logging
+import logging.handlers
+import queue
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue is in-process, so the record needs no pickling. The base
+        # prepare formats message and traceback here, on the event loop
+        return record
+
+
+def setup_queue_logging() -> logging.handlers.QueueListener:
+    """Route root logging through a queue drained on a background thread"""
+    root = logging.getLogger()
+    # Reuse any configured handlers on the listener side, else log to stderr
+    handlers = [
+        h for h in root.handlers if not isinstance(h, logging.handlers.QueueHandler)
+    ] or [logging.StreamHandler()]
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(log_queue))
+
+    return logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
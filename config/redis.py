@@ -0,0 +1,13 @@
+from fastapi import Request
+from redis.asyncio import Redis
+from config.settings import settings
+
+
+def create_redis() -> Redis:
+    """Create Redis client, connections are opened lazily by its pool"""
+    return Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+# Dependency to get the Redis client created on application startup
+async def get_redis(request: Request) -> Redis:
+    return request.app.state.redis
@@ -1,5 +1,6 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Tuple
 
 
 class Settings(BaseSettings):
@@ -11,6 +12,11 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "mysql+aiomysql://fastapi_user:password@db:3306/fastapi_db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_ISOLATION_LEVEL: str = "READ COMMITTED"
 
     # JWT
     JWT_SECRET_KEY: str = "change-me"
@@ -18,6 +24,21 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Argon2id cost, defaults are the OWASP 46 MiB profile. Stored hashes
+    # with other parameters are rehashed on the next successful login
+    ARGON2_MEMORY_KIB: int = 47104
+    ARGON2_TIME_COST: int = 1
+    ARGON2_PARALLELISM: int = 1
+
+    # Redis
+    REDIS_URL: str = "redis://redis:6379/0"
+    LOGIN_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_TTL_SECONDS: int = 60
+    # Per-process copy in front of Redis, 0 disables it. Kept short since
+    # other workers only see invalidations once their entry expires
+    USER_LOCAL_CACHE_TTL_SECONDS: int = 5
+    USER_LOCAL_CACHE_MAXSIZE: int = 10_000
+
     # CORS
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
 
@@ -25,15 +46,25 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 10
     MAX_PAGE_SIZE: int = 100
 
+    # Firebase, its routes and SDK are only loaded when enabled
+    FIREBASE_ENABLED: bool = False
+
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True,
         extra="ignore"
     )
 
+    @cached_property
+    def allowed_origins(self) -> Tuple[str, ...]:
+        """ALLOWED_ORIGINS parsed once into a tuple"""
+        return tuple(
+            origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()
+        )
+
     def get_allowed_origins(self) -> List[str]:
         """Parse ALLOWED_ORIGINS string into list"""
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+        return list(self.allowed_origins)
 
 
 settings = Settings()
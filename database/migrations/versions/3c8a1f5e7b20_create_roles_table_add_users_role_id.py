@@ -0,0 +1,53 @@
+"""Create roles table and add users.role_id
+
+Revision ID: 3c8a1f5e7b20
+Revises: c9aee1fdc42c
+Create Date: 2026-10-15 14:02:38.417605
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8a1f5e7b20'
+down_revision: Union[str, Sequence[str], None] = 'c9aee1fdc42c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    roles = op.create_table('roles',
+    sa.Column('role_name', sa.String(length=50), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_on', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_on', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('role_name')
+    )
+    # role_id defaults to 1 on the model, so the plain user role must get that id
+    op.bulk_insert(roles, [
+        {'id': 1, 'role_name': 'user', 'description': 'Regular user'},
+        {'id': 2, 'role_name': 'admin', 'description': 'Administrator'},
+    ])
+    op.add_column('users', sa.Column('role_id', sa.Integer(), server_default='1', nullable=False))
+    # Carry the old superuser flag over to the admin role
+    op.execute("UPDATE users SET role_id = 2 WHERE is_superuser = 1")
+    op.alter_column('users', 'role_id',
+               existing_type=sa.Integer(),
+               server_default=None,
+               existing_nullable=False)
+    op.create_index(op.f('ix_users_role_id'), 'users', ['role_id'], unique=False)
+    op.create_foreign_key('fk_users_role_id_roles', 'users', 'roles', ['role_id'], ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_users_role_id_roles', 'users', type_='foreignkey')
+    op.drop_index(op.f('ix_users_role_id'), table_name='users')
+    op.drop_column('users', 'role_id')
+    op.drop_table('roles')
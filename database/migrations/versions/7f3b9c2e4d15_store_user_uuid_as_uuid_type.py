@@ -0,0 +1,41 @@
+"""Store user uuid with the Uuid type
+
+Revision ID: 7f3b9c2e4d15
+Revises: b5e07d3a9f61
+Create Date: 2026-10-15 10:03:27.118954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3b9c2e4d15'
+down_revision: Union[str, Sequence[str], None] = 'b5e07d3a9f61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Uuid is stored as 32 hex chars without dashes on MySQL/MariaDB
+    op.execute("UPDATE users SET uuid = REPLACE(uuid, '-', '')")
+    op.alter_column('users', 'uuid',
+               existing_type=sa.String(length=36),
+               type_=sa.Uuid(),
+               existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('users', 'uuid',
+               existing_type=sa.Uuid(),
+               type_=sa.String(length=36),
+               existing_nullable=False)
+    op.execute(
+        "UPDATE users SET uuid = CONCAT_WS('-', SUBSTR(uuid, 1, 8), "
+        "SUBSTR(uuid, 9, 4), SUBSTR(uuid, 13, 4), SUBSTR(uuid, 17, 4), "
+        "SUBSTR(uuid, 21, 12))"
+    )
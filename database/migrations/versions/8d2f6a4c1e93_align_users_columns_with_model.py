@@ -0,0 +1,103 @@
+"""Align users columns with the User model
+
+Revision ID: 8d2f6a4c1e93
+Revises: 3c8a1f5e7b20
+Create Date: 2026-10-15 14:18:52.903114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f6a4c1e93'
+down_revision: Union[str, Sequence[str], None] = '3c8a1f5e7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The model maps hashed_password onto a column named password
+    op.alter_column('users', 'hashed_password',
+               new_column_name='password',
+               existing_type=sa.String(length=255),
+               existing_nullable=False)
+    op.alter_column('users', 'username',
+               existing_type=sa.String(length=100),
+               type_=sa.String(length=50),
+               existing_nullable=False)
+    op.alter_column('users', 'created_at',
+               new_column_name='created_on',
+               existing_type=sa.DateTime(timezone=True),
+               existing_server_default=sa.text('now()'),
+               existing_nullable=False)
+    op.alter_column('users', 'updated_at',
+               new_column_name='updated_on',
+               existing_type=sa.DateTime(timezone=True),
+               existing_server_default=sa.text('now()'),
+               existing_nullable=False)
+    op.execute("UPDATE users SET is_active = 1 WHERE is_active IS NULL")
+    op.alter_column('users', 'is_active',
+               existing_type=sa.Boolean(),
+               nullable=False)
+    op.create_index(op.f('ix_users_is_active'), 'users', ['is_active'], unique=False)
+    op.add_column('users', sa.Column('first_name', sa.String(length=100), nullable=False))
+    op.add_column('users', sa.Column('middle_name', sa.String(length=100), nullable=True))
+    op.add_column('users', sa.Column('last_name', sa.String(length=100), nullable=False))
+    op.add_column('users', sa.Column('phone_number', sa.String(length=20), nullable=False))
+    op.add_column('users', sa.Column('phone_number2', sa.String(length=20), nullable=True))
+    op.add_column('users', sa.Column('email_verified_on', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('users', sa.Column('deleted_on', sa.DateTime(timezone=True), nullable=True))
+    # Split full_name at the first space so existing users keep their names
+    op.execute(
+        "UPDATE users SET "
+        "first_name = LEFT(SUBSTRING_INDEX(full_name, ' ', 1), 100), "
+        "last_name = LEFT(TRIM(SUBSTRING(full_name, "
+        "CHAR_LENGTH(SUBSTRING_INDEX(full_name, ' ', 1)) + 1)), 100) "
+        "WHERE full_name IS NOT NULL"
+    )
+    # Superusers were mapped to the admin role by the previous revision
+    op.drop_column('users', 'is_superuser')
+    op.drop_column('users', 'full_name')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('users', sa.Column('full_name', sa.String(length=255), nullable=True))
+    op.add_column('users', sa.Column('is_superuser', sa.Boolean(), nullable=True))
+    op.execute(
+        "UPDATE users SET is_superuser = (role_id = 2), "
+        "full_name = NULLIF(CONCAT_WS(' ', first_name, middle_name, last_name), '')"
+    )
+    op.drop_column('users', 'deleted_on')
+    op.drop_column('users', 'email_verified_on')
+    op.drop_column('users', 'phone_number2')
+    op.drop_column('users', 'phone_number')
+    op.drop_column('users', 'last_name')
+    op.drop_column('users', 'middle_name')
+    op.drop_column('users', 'first_name')
+    op.drop_index(op.f('ix_users_is_active'), table_name='users')
+    op.alter_column('users', 'is_active',
+               existing_type=sa.Boolean(),
+               nullable=True)
+    op.alter_column('users', 'updated_on',
+               new_column_name='updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               existing_server_default=sa.text('now()'),
+               existing_nullable=False)
+    op.alter_column('users', 'created_on',
+               new_column_name='created_at',
+               existing_type=sa.DateTime(timezone=True),
+               existing_server_default=sa.text('now()'),
+               existing_nullable=False)
+    op.alter_column('users', 'username',
+               existing_type=sa.String(length=50),
+               type_=sa.String(length=100),
+               existing_nullable=False)
+    op.alter_column('users', 'password',
+               new_column_name='hashed_password',
+               existing_type=sa.String(length=255),
+               existing_nullable=False)
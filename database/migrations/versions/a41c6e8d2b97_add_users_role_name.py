@@ -0,0 +1,41 @@
+"""Add denormalized role_name to users
+
+Revision ID: a41c6e8d2b97
+Revises: 7f3b9c2e4d15
+Create Date: 2026-10-15 11:26:04.732810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c6e8d2b97'
+down_revision: Union[str, Sequence[str], None] = '7f3b9c2e4d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('role_name', sa.String(length=50), server_default='user', nullable=False))
+    op.create_index(op.f('ix_users_role_name'), 'users', ['role_name'], unique=False)
+    # Backfill from roles, then keep users in sync when a role is renamed
+    op.execute(
+        "UPDATE users JOIN roles ON roles.id = users.role_id "
+        "SET users.role_name = roles.role_name"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_roles_sync_user_role_name "
+        "AFTER UPDATE ON roles FOR EACH ROW "
+        "UPDATE users SET role_name = NEW.role_name WHERE role_id = NEW.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_roles_sync_user_role_name")
+    op.drop_index(op.f('ix_users_role_name'), table_name='users')
+    op.drop_column('users', 'role_name')
@@ -0,0 +1,35 @@
+"""Add uuid to users
+
+Revision ID: b5e07d3a9f61
+Revises: 8d2f6a4c1e93
+Create Date: 2026-10-15 14:37:09.285513
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e07d3a9f61'
+down_revision: Union[str, Sequence[str], None] = '8d2f6a4c1e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Dashed string form first, the next revision converts it to Uuid
+    op.add_column('users', sa.Column('uuid', sa.String(length=36), nullable=True))
+    op.execute("UPDATE users SET uuid = UUID()")
+    op.alter_column('users', 'uuid',
+               existing_type=sa.String(length=36),
+               nullable=False)
+    op.create_unique_constraint('uq_users_uuid', 'users', ['uuid'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_users_uuid', 'users', type_='unique')
+    op.drop_column('users', 'uuid')
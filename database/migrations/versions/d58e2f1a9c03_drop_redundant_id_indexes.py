@@ -0,0 +1,29 @@
+"""Drop redundant secondary index on users.id
+
+Revision ID: d58e2f1a9c03
+Revises: a41c6e8d2b97
+Create Date: 2026-10-15 12:04:51.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd58e2f1a9c03'
+down_revision: Union[str, Sequence[str], None] = 'a41c6e8d2b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # InnoDB clusters rows on the primary key, this index only costs writes
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
@@ -1,11 +1,15 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
 from app.models import User, Role
 
-from app.routes import auth_routes, user_routes, firebase_routes
+from app.routes import auth_routes, user_routes
 from app.middleware.cors import setup_cors
+from config.logging_config import setup_queue_logging
+from config.settings import settings
+from config.redis import create_redis
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.exceptions.handlers import (
     validation_exception_handler,
@@ -14,13 +18,29 @@ from app.exceptions.handlers import (
     general_exception_handler,
 )
 
-# Uncomment when Firebase is configured:
-# from app.utils.firebase_auth import initialize_firebase
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize shared services on startup and release them on shutdown"""
+    # Log records are formatted and written off the event loop
+    log_listener = setup_queue_logging()
+    log_listener.start()
+    app.state.redis = create_redis()
+    if settings.FIREBASE_ENABLED:
+        from app.utils.firebase_auth import initialize_firebase
+
+        initialize_firebase()
+    yield
+    await app.state.redis.aclose()
+    log_listener.stop()
+
 
 app = FastAPI(
     title="FastAPI MVC Application",
     description="FastAPI with MySQL/MariaDB and Firebase Auth",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Setup CORS middleware
@@ -35,15 +55,12 @@ app.add_exception_handler(Exception, general_exception_handler)  # type: ignore
 # Register routers
 app.include_router(auth_routes.router, prefix="/api")
 app.include_router(user_routes.router, prefix="/api")
-app.include_router(firebase_routes.router, prefix="/api")
 
+# Firebase is optional, skip importing its module unless enabled
+if settings.FIREBASE_ENABLED:
+    from app.routes import firebase_routes
 
-# Uncomment when Firebase is configured:
-# @app.on_event("startup")
-# async def startup_event():
-#     """Initialize services on application startup"""
-#     initialize_firebase()
-#     print("Application startup complete")
+    app.include_router(firebase_routes.router, prefix="/api")
 
 
 @app.get("/")
@@ -58,7 +75,7 @@ async def health_check():
 
 @app.get("/test")
 async def test():
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "message": "FastAPI is working!",
             "endpoints": ["/", "/health", "/docs", "/redoc"],